@@ -3,197 +3,486 @@
 A lightweight script to crawl all pages of a specified domain and output URL, title, and description to CSV
 指定ドメインの全ページをクロールして、URL、タイトル、ディスクリプションをCSVに出力する軽量スクリプト
 
-Uses requests + BeautifulSoup for fast crawling of standard websites
-requests + BeautifulSoupを使用した高速クロール（通常のウェブサイト向け）
+Uses httpx (HTTP/2) + selectolax (Lexbor) for fast concurrent crawling of standard websites
+httpx（HTTP/2）+ selectolax（Lexbor）を使用した高速並行クロール（通常のウェブサイト向け）
 
 For SPA (Single Page Application) sites, use crawl_pages_spa.py instead
 SPA（シングルページアプリケーション）サイトには crawl_pages_spa.py を使用してください
 """
 
 import csv
-from urllib.parse import urljoin, urlparse
-import time
+from urllib.parse import urljoin, urlparse, parse_qsl, urlencode
+import asyncio
 import argparse
-from collections import deque
+import codecs
+import concurrent.futures
+import functools
+import html
+import os
+import re
+import sqlite3
 import sys
 import signal
+import time
 from datetime import datetime
 
 try:
-    import requests
-    from bs4 import BeautifulSoup
+    import httpx
+    from selectolax.lexbor import LexborHTMLParser
 except ImportError:
     print("Error: Required packages are not installed / エラー: 必要なパッケージがインストールされていません")
-    print("Please run: pip install requests beautifulsoup4")
-    print("実行してください: pip install requests beautifulsoup4")
+    print("Please run: pip install 'httpx[http2]' selectolax")
+    print("実行してください: pip install 'httpx[http2]' selectolax")
     sys.exit(1)
 
+# Regex fast path for extraction: the common case needs no DOM at all
+# 抽出用の正規表現ファストパス: 通常のページではDOM構築自体が不要
+TITLE_RE = re.compile(rb'<title[^>]*>(.*?)</title>', re.IGNORECASE | re.DOTALL)
+# Both attribute orders, meta description before og:description
+# 属性の順序は両対応。meta descriptionをog:descriptionより優先
+DESC_RES = (
+    re.compile(rb'<meta\s[^>]*?name=["\']description["\'][^>]*?content=["\']([^"\']*)', re.IGNORECASE),
+    re.compile(rb'<meta\s[^>]*?content=["\']([^"\']*)["\'][^>]*?name=["\']description["\']', re.IGNORECASE),
+    re.compile(rb'<meta\s[^>]*?property=["\']og:description["\'][^>]*?content=["\']([^"\']*)', re.IGNORECASE),
+    re.compile(rb'<meta\s[^>]*?content=["\']([^"\']*)["\'][^>]*?property=["\']og:description["\']', re.IGNORECASE),
+)
+HREF_RE = re.compile(rb'<a\s[^>]*?href=["\']([^"\']+)', re.IGNORECASE)
+
+# Optional: Bloom filter for memory-efficient dedup on very large crawls
+# オプション: 超大規模クロール向けの省メモリ重複チェック用Bloomフィルター
+try:
+    from pybloom_live import ScalableBloomFilter
+except ImportError:
+    ScalableBloomFilter = None
+
+
+def extract_page_data(body, base_url, encoding=None):
+    """Extract title, description and links from raw HTML bytes / 生のHTMLバイト列からタイトル、ディスクリプション、リンクを抽出
+
+    Precompiled regexes cover the common case without building a DOM at
+    all; pages the regexes cannot read fall back to a real Lexbor parse.
+    Matched text is decoded with the charset the server declared
+    (Shift_JIS and EUC-JP sites are common input), falling back to UTF-8.
+    A module-level function so it can run in a worker process.
+    通常のページはコンパイル済み正規表現だけで抽出でき、DOM構築が不要。正規表現で読めないページのみLexborによる本物のパースにフォールバックする。
+    マッチしたテキストはサーバーが宣言したcharsetでデコードする（Shift_JISやEUC-JPのサイトは珍しくない）。不明な場合はUTF-8にフォールバック。
+    ワーカープロセスでも実行できるようモジュールレベルの関数にしている。
+    """
+    enc = encoding or 'utf-8'
+    try:
+        codecs.lookup(enc)
+    except LookupError:
+        enc = 'utf-8'
+
+    m = TITLE_RE.search(body)
+    title = html.unescape(m.group(1).decode(enc, 'ignore')).strip() if m else ''
+
+    description = ''
+    for desc_re in DESC_RES:
+        dm = desc_re.search(body)
+        if dm:
+            description = html.unescape(dm.group(1).decode(enc, 'ignore')).strip()
+            break
+
+    links = [
+        urljoin(base_url, html.unescape(href.decode(enc, 'ignore')))
+        for href in HREF_RE.findall(body)
+    ]
+
+    # No links from the regex pass — either a genuine dead end or markup the
+    # regexes cannot read (unquoted hrefs are valid HTML5 and common in
+    # minified output); let the real parser decide before dropping a subtree
+    # 正規表現でリンクが取れない場合は、本当にリンクのないページか、正規表現で読めないマークアップ（引用符なしのhrefはHTML5として有効で、minify済み出力ではよくある）のどちらか。サブツリーを取りこぼす前に本物のパーサーで確認する
+    if not links:
+        return _extract_page_data_dom(LexborHTMLParser(body.decode(enc, 'ignore')), base_url)
+
+    return title, description, links
+
+
+def _extract_page_data_dom(tree, base_url):
+    """Extract title, description and links in one DOM walk / 1回のDOM走査でタイトル、ディスクリプション、リンクを抽出
+
+    Separate css_first/css queries each traverse the tree; a single pass
+    gathers everything the crawler needs.
+    css_first/cssを個別に呼ぶとそのたびにツリーを走査するため、1回のパスで必要な情報をまとめて収集する。
+    """
+    title = ''
+    description = ''
+    og_description = ''
+    links = []
+
+    if tree.root is None:
+        return title, description, links
+
+    for node in tree.root.traverse(include_text=False):
+        tag = node.tag
+        if tag == 'a':
+            href = node.attributes.get('href')
+            if href:
+                # Convert to absolute URL / 絶対URLに変換
+                links.append(urljoin(base_url, href))
+        elif tag == 'title':
+            if not title:
+                title = node.text(strip=True)
+        elif tag == 'meta':
+            attrs = node.attributes
+            # meta description is preferred over og:description / meta descriptionをog:descriptionより優先
+            if not description and attrs.get('name') == 'description':
+                description = (attrs.get('content') or '').strip()
+            elif not og_description and attrs.get('property') == 'og:description':
+                og_description = (attrs.get('content') or '').strip()
+
+    return title, description or og_description, links
+
 
 class PageCrawler:
-    def __init__(self, domain, output_file='pages.csv', delay=0.5):
+    # Extensions to skip (file downloads, assets, etc.), as one precompiled regex
+    # スキップする拡張子（ファイルダウンロード、アセットなど）を1つのコンパイル済み正規表現で
+    _SKIP_RE = re.compile(
+        r'\.(?:pdf|zip|tar|gz|rar'
+        r'|jpe?g|png|gif|svg|webp|ico'
+        r'|mp3|mp4|avi|mov|wmv'
+        r'|docx?|xlsx?|pptx?'
+        r'|css|js|json|xml)$',
+        re.IGNORECASE
+    )
+
+    # Tracking params that only multiply the frontier with duplicate pages
+    # 重複ページでフロンティアを増殖させるだけのトラッキングパラメータ
+    TRACKING_PARAMS = frozenset({
+        'utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 'utm_content',
+        'gclid', 'fbclid', 'ref'
+    })
+
+    # Transient statuses worth retrying / リトライする価値のある一時的なステータス
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    MAX_RETRIES = 2
+
+    # Cap body size to bound memory on accidental huge pages (2 MiB)
+    # 巨大ページでのメモリ消費を抑えるための本文サイズ上限（2 MiB）
+    MAX_BODY_BYTES = 2 * 1024 * 1024
+
+    def __init__(self, domain, output_file='pages.csv', delay=0.5, concurrency=8,
+                 use_bloom=False, state_db=None, parse_processes=0):
         """
         Args:
             domain: Domain to crawl (e.g., https://example.com) / クロール対象のドメイン（例: https://example.com）
             output_file: Output CSV filename / 出力CSVファイル名
             delay: Delay between requests (seconds) / リクエスト間の待機時間（秒）
+            concurrency: Number of concurrent requests / 同時リクエスト数
+            use_bloom: Use Bloom filters for URL dedup (low memory, tiny false-positive rate)
+                       / URL重複チェックにBloomフィルターを使用（省メモリ、ごく僅かな偽陽性率）
+            state_db: sqlite file persisting the frontier for resumable crawls
+                      / クロールを再開可能にするためのフロンティア永続化用sqliteファイル
+            parse_processes: Offload HTML extraction to this many worker processes (0 = parse inline)
+                             / HTML抽出をこの数のワーカープロセスへ委譲（0 = インラインでパース）
         """
         self.domain = domain.rstrip('/')
+        # Parse the target domain once / 対象ドメインは一度だけパース
+        self._domain_netloc = urlparse(self.domain).netloc
         self.output_file = output_file
         self.delay = delay
-        self.visited = set()
-        self.to_visit = deque([self.domain])
-        self.results = []
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        })
+        self.concurrency = concurrency
+        self.to_visit = asyncio.Queue()
+        if use_bloom:
+            if ScalableBloomFilter is None:
+                print("Error: pybloom-live is not installed / エラー: pybloom-liveがインストールされていません")
+                print("Please run: pip install pybloom-live")
+                print("実行してください: pip install pybloom-live")
+                sys.exit(1)
+            # ~10 bits per URL instead of ~100 bytes per set entry
+            # set要素あたり約100バイトに対し、URLあたり約10ビットで済む
+            self.visited = ScalableBloomFilter(initial_capacity=100000, error_rate=1e-7)
+            self.queued = ScalableBloomFilter(initial_capacity=100000, error_rate=1e-7)
+        else:
+            self.visited = set()
+            # Everything ever enqueued, for O(1) dedup / キューに入れた全URL（O(1)の重複チェック用）
+            self.queued = set()
+
+        # Optional on-disk frontier so an interrupted crawl can be resumed
+        # 中断したクロールを再開できるようにするためのオプションのディスク上フロンティア
+        self._db = None
+        resuming = False
+        if state_db:
+            self._db = sqlite3.connect(state_db)
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS frontier (url TEXT PRIMARY KEY, visited INTEGER NOT NULL DEFAULT 0)'
+            )
+            self._db.commit()
+            rows = self._db.execute('SELECT url, visited FROM frontier').fetchall()
+            if rows:
+                resuming = True
+                pending = 0
+                for url, visited in rows:
+                    self.queued.add(url)
+                    if visited:
+                        self.visited.add(url)
+                    else:
+                        self.to_visit.put_nowait(url)
+                        pending += 1
+                print(f"Resuming crawl / クロールを再開: {len(rows) - pending} visited / 訪問済み, {pending} pending / 未訪問")
+
+        if not resuming:
+            self.to_visit.put_nowait(self.domain)
+            self.queued.add(self.domain)
+            self._mark_queued(self.domain)
+
+        # Stream rows straight to disk so memory stays flat and a crash
+        # never loses already-crawled pages; append when resuming
+        # 行を逐次ディスクへ書き出すことで、メモリ使用量を一定に保ち、クラッシュしても取得済みページを失わない。再開時は追記する
+        self.page_count = 0
+        append = resuming and os.path.exists(self.output_file)
+        self._csv_fp = open(self.output_file, 'a' if append else 'w', newline='', encoding='utf-8-sig')
+        self._csv_writer = csv.DictWriter(self._csv_fp, fieldnames=['url', 'title', 'description'])
+        if not append:
+            self._csv_writer.writeheader()
+        self.session = None
+        self.semaphore = None
         self.interrupted = False
+        self.parse_processes = parse_processes
+        self._parse_pool = None
+        # Rate limiter state: next time a request may start / レートリミッターの状態（次にリクエストを開始してよい時刻）
+        self._throttle_lock = None
+        self._next_request_at = 0.0
+
+    def _mark_queued(self, url):
+        """Record a newly enqueued URL in the on-disk frontier / 新たにキューへ入れたURLをディスク上のフロンティアに記録"""
+        if self._db is not None:
+            self._db.execute('INSERT OR IGNORE INTO frontier (url) VALUES (?)', (url,))
+
+    def _mark_visited(self, url):
+        """Mark a URL as visited in the on-disk frontier / ディスク上のフロンティアでURLを訪問済みにする"""
+        if self._db is not None:
+            self._db.execute(
+                'INSERT INTO frontier (url, visited) VALUES (?, 1) '
+                'ON CONFLICT(url) DO UPDATE SET visited = 1',
+                (url,)
+            )
+            self._db.commit()
+
+    def is_same_domain(self, parsed):
+        """Check if parsed URL belongs to the same domain / パース済みURLが同じドメインかどうかをチェック"""
+        return parsed.netloc == self._domain_netloc
+
+    def is_valid_page_url(self, parsed):
+        """Check if parsed URL is a valid page URL (not a file download, etc.) / パース済みURLが有効なページURLかチェック"""
+        return not self._SKIP_RE.search(parsed.path)
+
+    @functools.lru_cache(maxsize=65536)
+    def _filter_and_normalize(self, url):
+        """Parse a URL once and return (normalized, same_domain, valid_page) / URLを一度だけパースして (正規化URL, 同一ドメインか, 有効ページか) を返す
+
+        The same hrefs ("/", "/about", ...) recur on every page, so the result is cached.
+        同じhref（"/" や "/about" など）は全ページで繰り返し現れるため、結果をキャッシュする。
+        """
+        # Normalize by slicing (strip fragment and trailing slash) instead of
+        # rebuilding the URL from parsed parts — much cheaper on this hot path
+        # パース結果からURLを組み立て直すのではなく、スライスで正規化（フラグメントと末尾スラッシュを削除）— このホットパスでは大幅に軽い
+        i = url.find('#')
+        if i >= 0:
+            url = url[:i]
+
+        # Canonicalize the query: drop tracking params and sort the rest, so
+        # ?a=1&b=2 and ?b=2&a=1 (or extra utm_* noise) dedupe to one fetch
+        # クエリを正規化: トラッキングパラメータを除去し残りをソート。?a=1&b=2 と ?b=2&a=1（やutm_*のノイズ付き）が1回の取得にまとまる
+        qi = url.find('?')
+        if qi >= 0:
+            base, query = url[:qi], url[qi + 1:]
+            params = [(k, v) for k, v in parse_qsl(query, keep_blank_values=True)
+                      if k not in self.TRACKING_PARAMS]
+            params.sort()
+            url = f"{base}?{urlencode(params)}" if params else base
+
+        normalized = url.rstrip('/') or self.domain
+
+        # urlparse is still needed once for the netloc/path checks / netloc・pathのチェックには一度だけurlparseが必要
+        try:
+            parsed = urlparse(normalized)
+        except ValueError:
+            return normalized, False, False
+
+        return normalized, self.is_same_domain(parsed), self.is_valid_page_url(parsed)
+
+    async def _throttle(self):
+        """Space out request starts by the politeness delay / リクエストの開始間隔に待機時間を適用
+
+        Only the start times are rate-limited (1/delay requests per second);
+        in-flight requests still overlap, unlike a sleep after each fetch.
+        レート制限するのは開始時刻のみ（毎秒 1/delay リクエスト）。取得後にsleepする方式と違い、実行中のリクエストは重なり合える。
+        """
+        if self.delay <= 0:
+            return
+        async with self._throttle_lock:
+            now = time.monotonic()
+            wait = self._next_request_at - now
+            self._next_request_at = max(now, self._next_request_at) + self.delay
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    async def _process_url(self, url):
+        """Fetch and parse a single URL, enqueue discovered links / 1つのURLを取得・パースして、発見したリンクをキューに追加
+
+        Every queued URL is already normalized, same-domain, valid and
+        deduplicated at enqueue time, so nothing is re-checked here.
+        キュー内のURLはキュー追加時に正規化・フィルタ・重複排除済みのため、ここでは再チェックしない。
+        """
+        # In-memory only at this point; the on-disk frontier is marked once
+        # the row is written, so an interrupt mid-fetch retries the URL on resume
+        # この時点ではメモリ上のみ。ディスク上のフロンティアは行の書き込み後に記録するため、取得中に中断してもそのURLは再開時にリトライされる
+        self.visited.add(url)
 
-    def is_same_domain(self, url):
-        """Check if URL belongs to the same domain / URLが同じドメインかどうかをチェック"""
         try:
-            parsed = urlparse(url)
-            domain_parsed = urlparse(self.domain)
-            return parsed.netloc == domain_parsed.netloc
-        except:
-            return False
-
-    def normalize_url(self, url):
-        """Normalize URL (remove fragments, etc.) / URLを正規化（フラグメントを削除など）"""
-        parsed = urlparse(url)
-        normalized = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
-        if parsed.query:
-            normalized += f"?{parsed.query}"
-        return normalized.rstrip('/') or self.domain
-
-    def is_valid_page_url(self, url):
-        """Check if URL is a valid page URL (not a file download, etc.) / URLが有効なページURLかチェック"""
-        skip_extensions = (
-            '.pdf', '.zip', '.tar', '.gz', '.rar',
-            '.jpg', '.jpeg', '.png', '.gif', '.svg', '.webp', '.ico',
-            '.mp3', '.mp4', '.avi', '.mov', '.wmv',
-            '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx',
-            '.css', '.js', '.json', '.xml'
-        )
-        parsed = urlparse(url)
-        path_lower = parsed.path.lower()
-        return not path_lower.endswith(skip_extensions)
-
-    def extract_page_info(self, soup):
-        """Extract title and description from BeautifulSoup object / BeautifulSoupオブジェクトからタイトルとディスクリプションを抽出"""
-        # Extract title / タイトルの取得
-        title = ''
-        if soup.title and soup.title.string:
-            title = soup.title.string.strip()
-
-        # Extract description (meta description) / ディスクリプションの取得（meta description）
-        description = ''
-        meta_desc = soup.find('meta', attrs={'name': 'description'})
-        if not meta_desc:
-            meta_desc = soup.find('meta', attrs={'property': 'og:description'})
-        if meta_desc and meta_desc.get('content'):
-            description = meta_desc['content'].strip()
-
-        return title, description
-
-    def extract_links(self, soup, base_url):
-        """Extract all links from BeautifulSoup object / BeautifulSoupオブジェクトから全てのリンクを抽出"""
-        links = []
-        for anchor in soup.find_all('a', href=True):
-            href = anchor['href']
-            # Convert to absolute URL / 絶対URLに変換
-            absolute_url = urljoin(base_url, href)
-            links.append(absolute_url)
-        return links
-
-    def crawl(self):
+            # Limit in-flight requests and keep the delay per request slot
+            # 同時リクエスト数を制限し、スロットごとに待機時間を挟む
+            async with self.semaphore:
+                await self._throttle()
+                print(f"Fetching / 取得中: {url}")
+                body = None
+                encoding = None
+                for attempt in range(self.MAX_RETRIES + 1):
+                    async with self.session.stream('GET', url) as response:
+                        # Retry transient server errors with backoff / 一時的なサーバーエラーはバックオフ付きでリトライ
+                        if (response.status_code in self.RETRY_STATUSES and
+                                attempt < self.MAX_RETRIES):
+                            await asyncio.sleep(0.3 * (2 ** attempt))
+                            continue
+                        response.raise_for_status()
+
+                        # Check if response is HTML before touching the body; leaving
+                        # the block unread means it is never downloaded
+                        # 本文に触れる前にHTMLかチェック。読まずにブロックを抜ければ本文はダウンロードされない
+                        content_type = response.headers.get('Content-Type', '')
+                        if 'text/html' not in content_type:
+                            print(f"  - Skipped (not HTML) / スキップ（HTML以外）")
+                            # A definitive outcome — no need to refetch on resume
+                            # 結果が確定したので再開時の再取得は不要
+                            self._mark_visited(url)
+                            return
+
+                        # Charset comes from the Content-Type header; the body
+                        # is decoded with it during extraction
+                        # charsetはContent-Typeヘッダーから取得し、抽出時の本文デコードに使う
+                        encoding = response.charset_encoding
+
+                        # Read at most MAX_BODY_BYTES / 最大MAX_BODY_BYTESまで読み込む
+                        chunks = []
+                        size = 0
+                        async for chunk in response.aiter_bytes():
+                            chunks.append(chunk)
+                            size += len(chunk)
+                            if size >= self.MAX_BODY_BYTES:
+                                break
+                        body = b''.join(chunks)
+                    break
+
+            # Extract title, description and links in one pass; with a parse
+            # pool the CPU work runs outside the event-loop process
+            # タイトル、ディスクリプション、リンクを一括抽出。パースプール使用時はCPU処理をイベントループ外のプロセスで実行
+            if self._parse_pool is not None:
+                loop = asyncio.get_running_loop()
+                title, description, links = await loop.run_in_executor(
+                    self._parse_pool, extract_page_data, body, url, encoding)
+            else:
+                title, description, links = extract_page_data(body, url, encoding)
+
+            # Write the row out immediately / 行を即座に書き出す
+            self._csv_writer.writerow({
+                'url': url,
+                'title': title,
+                'description': description
+            })
+            self._csv_fp.flush()
+            self.page_count += 1
+            self._mark_visited(url)
+
+            title_display = title[:50] + '...' if len(title) > 50 else title
+            print(f"  ✓ Title / タイトル: {title_display}")
+
+            # Add extracted links to queue / 抽出したリンクをキューに追加
+            for link in links:
+                normalized_link, same_domain, valid_page = self._filter_and_normalize(link)
+                if (same_domain and valid_page and
+                        normalized_link not in self.queued):
+                    self.queued.add(normalized_link)
+                    self._mark_queued(normalized_link)
+                    self.to_visit.put_nowait(normalized_link)
+
+        except httpx.TimeoutException:
+            print(f"  ✗ Timeout / タイムアウト")
+        except httpx.HTTPError as e:
+            print(f"  ✗ Error / エラー: {e}")
+        except Exception as e:
+            print(f"  ✗ Error / エラー: {e}")
+
+    async def _worker(self):
+        """Worker task pulling URLs from the queue / キューからURLを取り出すワーカータスク"""
+        while not self.interrupted:
+            url = await self.to_visit.get()
+            try:
+                await self._process_url(url)
+            finally:
+                self.to_visit.task_done()
+
+    async def crawl(self):
         """Main crawling process / メインのクロール処理"""
         print(f"Crawling started (Simple mode) / クロール開始（シンプルモード）: {self.domain}")
         print(f"Output file / 出力ファイル: {self.output_file}")
         print("-" * 50)
 
-        while self.to_visit and not self.interrupted:
-            url = self.to_visit.popleft()
-            normalized_url = self.normalize_url(url)
+        self.semaphore = asyncio.Semaphore(self.concurrency)
+        self._throttle_lock = asyncio.Lock()
+        if self.parse_processes > 0:
+            self._parse_pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.parse_processes)
+        headers = {
+            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            # Compressed HTML is ~5x smaller on the wire / 圧縮HTMLは転送量が約1/5
+            'Accept-Encoding': 'gzip, deflate'
+        }
+        # The crawl hits a single host: with HTTP/2 all requests multiplex over
+        # one TCP+TLS connection; the limits only matter on HTTP/1.1-only servers
+        # クロール先は単一ホスト。HTTP/2なら全リクエストが1本のTCP+TLS接続に多重化され、limitsはHTTP/1.1のみのサーバーでだけ効く
+        limits = httpx.Limits(
+            max_connections=self.concurrency,
+            max_keepalive_connections=self.concurrency
+        )
 
-            # Skip if already visited / 既に訪問済みの場合はスキップ
-            if normalized_url in self.visited:
-                continue
+        async with httpx.AsyncClient(http2=True, follow_redirects=True,
+                                     headers=headers, timeout=10, limits=limits) as session:
+            self.session = session
 
-            # Skip if not same domain / 同じドメインでない場合はスキップ
-            if not self.is_same_domain(normalized_url):
-                continue
+            # Spawn worker tasks / ワーカータスクを起動
+            workers = [asyncio.create_task(self._worker()) for _ in range(self.concurrency)]
 
-            # Skip if not a valid page URL / 有効なページURLでない場合はスキップ
-            if not self.is_valid_page_url(normalized_url):
-                continue
+            # Wait until the queue is fully drained / キューが空になるまで待機
+            await self.to_visit.join()
 
-            self.visited.add(normalized_url)
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
 
-            try:
-                print(f"Fetching / 取得中: {normalized_url}")
-                response = self.session.get(normalized_url, timeout=10)
-                response.raise_for_status()
-
-                # Check if response is HTML / レスポンスがHTMLかチェック
-                content_type = response.headers.get('Content-Type', '')
-                if 'text/html' not in content_type:
-                    print(f"  - Skipped (not HTML) / スキップ（HTML以外）")
-                    continue
-
-                soup = BeautifulSoup(response.text, 'html.parser')
-
-                # Extract title and description / タイトルとディスクリプションの抽出
-                title, description = self.extract_page_info(soup)
-
-                # Add to results / 結果に追加
-                self.results.append({
-                    'url': normalized_url,
-                    'title': title,
-                    'description': description
-                })
-
-                title_display = title[:50] + '...' if len(title) > 50 else title
-                print(f"  ✓ Title / タイトル: {title_display}")
-
-                # Extract links and add to queue / リンクを抽出してキューに追加
-                links = self.extract_links(soup, normalized_url)
-                for link in links:
-                    normalized_link = self.normalize_url(link)
-                    if (self.is_same_domain(normalized_link) and
-                        self.is_valid_page_url(normalized_link) and
-                        normalized_link not in self.visited and
-                        normalized_link not in self.to_visit):
-                        self.to_visit.append(normalized_link)
-
-                # Delay between requests / リクエスト間の待機時間
-                time.sleep(self.delay)
-
-            except requests.Timeout:
-                print(f"  ✗ Timeout / タイムアウト")
-                continue
-            except requests.RequestException as e:
-                print(f"  ✗ Error / エラー: {e}")
-                continue
-            except Exception as e:
-                print(f"  ✗ Error / エラー: {e}")
-                continue
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown()
+            self._parse_pool = None
 
         print("-" * 50)
-        print(f"Crawling completed / クロール完了: {len(self.results)} pages fetched / ページを取得")
+        print(f"Crawling completed / クロール完了: {self.page_count} pages fetched / ページを取得")
 
-    def save_to_csv(self):
-        """Save results to CSV file / 結果をCSVファイルに保存"""
-        if not self.results:
-            print("No results to save / 保存する結果がありません")
-            return
+    def close_csv(self):
+        """Flush and close the CSV file and frontier DB / CSVファイルとフロンティアDBをフラッシュして閉じる"""
+        if self._db is not None:
+            self._db.commit()
+            self._db.close()
+            self._db = None
 
-        with open(self.output_file, 'w', newline='', encoding='utf-8-sig') as f:
-            writer = csv.DictWriter(f, fieldnames=['url', 'title', 'description'])
-            writer.writeheader()
-            writer.writerows(self.results)
+        if self._csv_fp.closed:
+            return
+        self._csv_fp.close()
 
-        print(f"Saved {len(self.results)} pages to CSV file / {len(self.results)}ページをCSVファイルに保存しました: {self.output_file}")
+        if not self.page_count:
+            print("No results to save / 保存する結果がありません")
+            return
+        print(f"Saved {self.page_count} pages to CSV file / {self.page_count}ページをCSVファイルに保存しました: {self.output_file}")
 
 
 def get_domain_filename(domain_url):
@@ -223,6 +512,28 @@ def main():
         default=0.5,
         help='Delay between requests in seconds (default: 0.5) / リクエスト間の待機時間（秒）（デフォルト: 0.5）'
     )
+    parser.add_argument(
+        '-c', '--concurrency',
+        type=int,
+        default=8,
+        help='Number of concurrent requests (default: 8) / 同時リクエスト数（デフォルト: 8）'
+    )
+    parser.add_argument(
+        '--bloom',
+        action='store_true',
+        help='Use Bloom filters for URL dedup on very large crawls (requires pybloom-live) / 超大規模クロール向けにURL重複チェックへBloomフィルターを使用（pybloom-liveが必要）'
+    )
+    parser.add_argument(
+        '--state-db',
+        default=None,
+        help='sqlite file to persist crawl state; rerun with the same file to resume / クロール状態を保存するsqliteファイル（同じファイルで再実行すると再開）'
+    )
+    parser.add_argument(
+        '--parse-processes',
+        type=int,
+        default=0,
+        help='Offload HTML parsing to N worker processes, for parse-heavy crawls (default: 0 = inline) / HTMLパースをN個のワーカープロセスへ委譲（パース負荷が高いクロール向け、デフォルト: 0 = インライン）'
+    )
 
     args = parser.parse_args()
 
@@ -237,27 +548,32 @@ def main():
     crawler = PageCrawler(
         args.domain,
         output_file,
-        args.delay
+        args.delay,
+        args.concurrency,
+        use_bloom=args.bloom,
+        state_db=args.state_db,
+        parse_processes=args.parse_processes
     )
 
-    # Set up signal handler to save results on interrupt / 中断時に結果を保存するシグナルハンドラーを設定
+    # Set up signal handler to keep partial results on interrupt / 中断時に途中結果を残すシグナルハンドラーを設定
+    # Rows are already on disk, so only the file needs closing / 行は既にディスク上にあるため、ファイルを閉じるだけでよい
     def signal_handler(signum, frame):
         print("\n" + "-" * 50)
-        print("Interrupted! Saving partial results... / 中断されました！途中結果を保存します...")
+        print("Interrupted! Partial results are saved / 中断されました！途中結果は保存済みです")
         crawler.interrupted = True
-        crawler.save_to_csv()
+        crawler.close_csv()
         sys.exit(0)
 
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
 
     try:
-        crawler.crawl()
+        asyncio.run(crawler.crawl())
     except Exception as e:
         print(f"\nUnexpected error occurred / 予期しないエラーが発生しました: {e}")
-        print("Saving partial results... / 途中結果を保存します...")
+        print("Partial results are saved / 途中結果は保存済みです")
     finally:
-        crawler.save_to_csv()
+        crawler.close_csv()
 
 
 if __name__ == '__main__':
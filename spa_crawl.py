@@ -14,73 +14,173 @@ For standard websites, use crawl_pages_simple.py for faster crawling.
 
 import csv
 from urllib.parse import urljoin, urlparse
+import asyncio
 import time
 import argparse
-from collections import deque
+import functools
+import os
+import re
 import sys
 import signal
 from datetime import datetime
 
 try:
-    from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
+    from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout
 except ImportError:
     print("Error: Playwright is not installed / エラー: Playwrightがインストールされていません")
     print("Please run: pip install playwright && playwright install chromium")
     print("実行してください: pip install playwright && playwright install chromium")
     sys.exit(1)
 
+try:
+    import httpx
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    print("Error: Required packages are not installed / エラー: 必要なパッケージがインストールされていません")
+    print("Please run: pip install 'httpx[http2]' selectolax")
+    print("実行してください: pip install 'httpx[http2]' selectolax")
+    sys.exit(1)
+
+# Optional: Bloom filter for memory-efficient dedup on very large crawls
+# オプション: 超大規模クロール向けの省メモリ重複チェック用Bloomフィルター
+try:
+    from pybloom_live import ScalableBloomFilter
+except ImportError:
+    ScalableBloomFilter = None
+
 
 class PageCrawler:
-    def __init__(self, domain, output_file='pages.csv', delay=1.0, headless=True):
+    # Extensions to skip (file downloads, assets, etc.), as one precompiled regex
+    # スキップする拡張子（ファイルダウンロード、アセットなど）を1つのコンパイル済み正規表現で
+    _SKIP_RE = re.compile(
+        r'\.(?:pdf|zip|tar|gz|rar'
+        r'|jpe?g|png|gif|svg|webp|ico'
+        r'|mp3|mp4|avi|mov|wmv'
+        r'|docx?|xlsx?|pptx?'
+        r'|css|js|json|xml)$',
+        re.IGNORECASE
+    )
+
+    # Resource types the extractor never needs / 抽出に不要なリソースタイプ
+    BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font', 'stylesheet'})
+
+    # Known analytics/tracking hosts / 既知のアナリティクス・トラッキングホスト
+    BLOCKED_HOST_KEYWORDS = (
+        'google-analytics.com', 'googletagmanager.com', 'doubleclick.net',
+        'connect.facebook.net', 'facebook.com/tr', 'hotjar.com'
+    )
+
+    # Cap document size to bound memory on accidental huge pages (2 MiB)
+    # 巨大ページでのメモリ消費を抑えるためのドキュメントサイズ上限（2 MiB）
+    MAX_BODY_BYTES = 2 * 1024 * 1024
+
+    # Distinct from None ("needs the browser"): this page must not be crawled
+    # on either path / None（ブラウザが必要）と区別する「どちらの経路でもクロールしない」印
+    _SKIP = object()
+
+    def __init__(self, domain, output_file='pages.csv', delay=1.0, headless=True,
+                 concurrency=4, use_bloom=False):
         """
         Args:
             domain: Domain to crawl (e.g., https://example.com) / クロール対象のドメイン（例: https://example.com）
             output_file: Output CSV filename / 出力CSVファイル名
             delay: Delay between requests (seconds) / リクエスト間の待機時間（秒）
             headless: Run browser in headless mode / ヘッドレスモードでブラウザを実行
+            concurrency: Number of pages crawled in parallel / 並行してクロールするページ数
+            use_bloom: Use Bloom filters for URL dedup (low memory, tiny false-positive rate)
+                       / URL重複チェックにBloomフィルターを使用（省メモリ、ごく僅かな偽陽性率）
         """
         self.domain = domain.rstrip('/')
+        # Parse the target domain once / 対象ドメインは一度だけパース
+        self._domain_netloc = urlparse(self.domain).netloc
         self.output_file = output_file
         self.delay = delay
         self.headless = headless
-        self.visited = set()
-        self.to_visit = deque([self.domain])
-        self.results = []
+        self.concurrency = concurrency
+        self.to_visit = asyncio.Queue()
+        self.to_visit.put_nowait(self.domain)
+        if use_bloom:
+            if ScalableBloomFilter is None:
+                print("Error: pybloom-live is not installed / エラー: pybloom-liveがインストールされていません")
+                print("Please run: pip install pybloom-live")
+                print("実行してください: pip install pybloom-live")
+                sys.exit(1)
+            # ~10 bits per URL instead of ~100 bytes per set entry
+            # set要素あたり約100バイトに対し、URLあたり約10ビットで済む
+            self.visited = ScalableBloomFilter(initial_capacity=100000, error_rate=1e-7)
+            self.seen = ScalableBloomFilter(initial_capacity=100000, error_rate=1e-7)
+            self.seen.add(self.domain)
+        else:
+            self.visited = set()
+            # Everything ever enqueued or visited, for O(1) dedup / キューに入れた・訪問した全URL（O(1)の重複チェック用）
+            self.seen = {self.domain}
+        self.page_count = 0
+        # Stream rows straight to disk instead of buffering every page in a
+        # results list — memory stays flat and an interrupt loses nothing
+        # 結果をリストに溜めずディスクへ直接ストリーム書き込み。メモリは一定に保たれ、中断してもデータは失われない
+        # 1 MiB buffer + periodic flush: rows hit the OS in batches instead
+        # of one syscall per page / 1 MiBバッファ＋定期フラッシュ: 行はページごとの1システムコールではなくまとめてOSへ渡る
+        self._csv_fp = open(self.output_file, 'w', newline='', encoding='utf-8-sig',
+                            buffering=1 << 20)
+        self._csv_writer = csv.DictWriter(self._csv_fp, fieldnames=['url', 'title', 'description'])
+        self._csv_writer.writeheader()
         self.playwright = None
-        self.browser = None
-        self.page = None
-
-    def is_same_domain(self, url):
-        """Check if URL belongs to the same domain / URLが同じドメインかどうかをチェック"""
+        self.context = None
+        self.interrupted = False
+        # Per-host politeness gate: earliest monotonic time the next request
+        # to each host may start / ホストごとのポライトネスゲート: 各ホストへの次リクエストを開始してよい最早時刻（monotonic）
+        self._throttle_lock = None
+        self._next_ok_at = {}
+        self._http = None
+
+    def is_same_domain(self, parsed):
+        """Check if parsed URL belongs to the same domain / パース済みURLが同じドメインかどうかをチェック"""
+        return parsed.netloc == self._domain_netloc
+
+    def is_valid_page_url(self, parsed):
+        """Check if parsed URL is a valid page URL (not a file download, etc.) / パース済みURLが有効なページURLかチェック"""
+        return self._SKIP_RE.search(parsed.path) is None
+
+    @functools.lru_cache(maxsize=200000)
+    def _filter_and_normalize(self, url):
+        """Parse a URL once and return (normalized, same_domain, valid_page) / URLを一度だけパースして (正規化URL, 同一ドメインか, 有効ページか) を返す
+
+        The old normalize_url/is_same_domain/is_valid_page_url trio parsed the
+        same URL up to four times; the same hrefs also recur on every page, so
+        the result is cached.
+        従来のnormalize_url/is_same_domain/is_valid_page_urlは同じURLを最大4回パースしていた。同じhrefは全ページで繰り返し現れるため、結果もキャッシュする。
+        """
         try:
             parsed = urlparse(url)
-            domain_parsed = urlparse(self.domain)
-            return parsed.netloc == domain_parsed.netloc
-        except:
-            return False
+        except ValueError:
+            return url, False, False
 
-    def normalize_url(self, url):
-        """Normalize URL (remove fragments, etc.) / URLを正規化（フラグメントを削除など）"""
-        parsed = urlparse(url)
+        # Normalize URL (remove fragments, etc.) / URLを正規化（フラグメントを削除など）
         normalized = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
         if parsed.query:
             normalized += f"?{parsed.query}"
-        return normalized.rstrip('/') or self.domain
-
-    def is_valid_page_url(self, url):
-        """Check if URL is a valid page URL (not a file download, etc.) / URLが有効なページURLかチェック"""
-        skip_extensions = (
-            '.pdf', '.zip', '.tar', '.gz', '.rar',
-            '.jpg', '.jpeg', '.png', '.gif', '.svg', '.webp', '.ico',
-            '.mp3', '.mp4', '.avi', '.mov', '.wmv',
-            '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx',
-            '.css', '.js', '.json', '.xml'
-        )
-        parsed = urlparse(url)
-        path_lower = parsed.path.lower()
-        return not path_lower.endswith(skip_extensions)
+        normalized = normalized.rstrip('/') or self.domain
 
-    def wait_for_spa_render(self, timeout=5000):
+        return normalized, self.is_same_domain(parsed), self.is_valid_page_url(parsed)
+
+    async def _throttle(self, host):
+        """Wait until this host's politeness slot opens / 対象ホストのポライトネス枠が空くまで待機
+
+        Unlike the old unconditional sleep after every fetch, this gates
+        request *starts* per host, so render and teardown time already count
+        toward the delay and parallel workers don't stack their waits.
+        従来の毎回無条件のsleepと違い、ホストごとにリクエストの開始だけを間隔制御する。レンダリングや後処理の時間も待機に算入され、並行ワーカーの待ちが積み重ならない。
+        """
+        if self.delay <= 0:
+            return
+        async with self._throttle_lock:
+            now = time.monotonic()
+            wait = self._next_ok_at.get(host, 0.0) - now
+            self._next_ok_at[host] = max(now, self._next_ok_at.get(host, 0.0)) + self.delay
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    async def wait_for_spa_render(self, page, timeout=5000):
         """
         Wait for SPA to finish rendering / SPAのレンダリング完了を待機
 
@@ -89,174 +189,363 @@ class PageCrawler:
         """
         try:
             # Wait for network to be idle / ネットワークが落ち着くまで待機
-            self.page.wait_for_load_state('networkidle', timeout=timeout)
+            await page.wait_for_load_state('networkidle', timeout=timeout)
         except PlaywrightTimeout:
             pass
 
         # Wait for title to change from initial state / タイトルが初期状態から変更されるまで待機
         try:
             # Check if title is a typical SPA placeholder / タイトルがSPAの典型的なプレースホルダーかチェック
-            initial_title = self.page.title() or ''
+            initial_title = await page.title() or ''
             spa_placeholders = ['', 'loading', 'Loading', 'Loading...', '読み込み中']
 
             if initial_title.strip().lower() in [p.lower() for p in spa_placeholders]:
                 # Wait for title to change / タイトルが変更されるまで待機
                 for _ in range(10):  # Max 10 retries
-                    time.sleep(0.5)
-                    new_title = self.page.title() or ''
+                    await asyncio.sleep(0.5)
+                    new_title = await page.title() or ''
                     if new_title.strip().lower() not in [p.lower() for p in spa_placeholders]:
                         break
         except:
             pass
 
-    def extract_page_info(self):
-        """Extract title and description from current page / 現在のページからタイトルとディスクリプションを抽出"""
-        # Extract title / タイトルの取得
+    # Single in-page call gathering everything the crawler needs
+    # クローラーが必要とする情報をページ内の1回の呼び出しでまとめて取得
+    _EXTRACT_JS = """() => ({
+        title: document.title || '',
+        description: (document.querySelector('meta[name="description"]')
+                   || document.querySelector('meta[property="og:description"]'))?.content?.trim() || '',
+        links: Array.from(document.querySelectorAll('a[href]'), a => a.href)
+    })"""
+
+    async def extract_page_data(self, page):
+        """Extract title, description and links in one evaluate call / 1回のevaluate呼び出しでタイトル、ディスクリプション、リンクを抽出
+
+        Each page.title/query_selector/get_attribute is a full CDP round-trip,
+        so a page with 200 links used to cost ~200 of them. a.href already
+        resolves against document.baseURI, so the links come back absolute.
+        page.title/query_selector/get_attributeは1回ごとにCDPの往復が発生するため、リンク200本のページでは約200往復かかっていた。a.hrefはdocument.baseURI基準で解決済みなので、リンクは絶対URLで返る。
+        """
         try:
-            title = self.page.title() or ''
-        except:
-            title = ''
+            data = await page.evaluate(self._EXTRACT_JS)
+            return data['title'], data['description'], data['links']
+        except Exception:
+            # evaluate can fail on pages with a strict CSP or a wedged JS
+            # context — pull the rendered HTML once and parse it locally
+            # 厳格なCSPやJSコンテキストの異常でevaluateが失敗することがある。その場合はレンダリング済みHTMLを一度だけ取得してローカルでパースする
+            try:
+                tree = LexborHTMLParser(await page.content())
+            except Exception:
+                return '', '', []
+            return self._extract_from_tree(tree, page.url)
+
+    async def _route_filter(self, route):
+        """Abort image/media/font/stylesheet and analytics requests / 画像・メディア・フォント・CSSおよびアナリティクスのリクエストを中断
+
+        Only <title>, <meta> and <a href> are extracted, so subresources that
+        exist purely for rendering are dead weight; document and xhr/fetch
+        stay enabled so SPA routing still loads.
+        抽出するのは<title>・<meta>・<a href>のみなので、描画のためだけのサブリソースは無駄。documentとxhr/fetchは許可したままにし、SPAのルーティングは通常どおり動作する。
+        """
+        request = route.request
+        if request.resource_type in self.BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+            return
+        url = request.url
+        if any(host in url for host in self.BLOCKED_HOST_KEYWORDS):
+            await route.abort()
+            return
+        if request.resource_type == 'document':
+            # Fetch headers first and refuse documents over the size cap —
+            # HTML-rendered sitemaps and archive listings otherwise stall a
+            # worker for the full multi-MB download
+            # まずヘッダーを取得し、サイズ上限を超えるドキュメントを拒否する。HTMLで出力されたサイトマップやアーカイブ一覧は、放置するとワーカーが数MBのダウンロードで止まってしまう
+            try:
+                response = await route.fetch()
+                if int(response.headers.get('content-length') or 0) > self.MAX_BODY_BYTES:
+                    await route.abort()
+                    return
+                await route.fulfill(response=response)
+            except Exception:
+                await route.abort()
+            return
+        await route.continue_()
 
-        # Extract description (meta description) / ディスクリプションの取得（meta description）
-        description = ''
-        try:
-            meta_desc = self.page.query_selector('meta[name="description"]')
-            if not meta_desc:
-                meta_desc = self.page.query_selector('meta[property="og:description"]')
-            if meta_desc:
-                description = meta_desc.get_attribute('content') or ''
-                description = description.strip()
-        except:
-            pass
+    async def start_browser(self):
+        """Start Playwright browser / Playwrightブラウザを起動"""
+        self.playwright = await async_playwright().start()
+        # One persistent context shared by all workers: tabs are ~10x cheaper
+        # to open than contexts, and the on-disk profile keeps the HTTP and
+        # compiled-JS caches warm across runs, so repeat crawls of the same
+        # domain skip re-downloading the site's JS bundles.
+        # 全ワーカーで1つの永続コンテキストを共有: タブはコンテキストより約10倍軽く、ディスク上のプロファイルがHTTP・コンパイル済みJSキャッシュを実行をまたいで保持するため、同じドメインの再クロールではJSバンドルの再ダウンロードを省ける
+        # Launch args strip Chromium services the crawler never uses: faster
+        # cold start, less CPU and memory per page. imagesEnabled=false stops
+        # image decoding in-browser, one layer below the route filter.
+        # 起動引数でクローラーが使わないChromiumのサービスを無効化: 起動が速くなり、ページあたりのCPU・メモリも減る。imagesEnabled=falseはルートフィルターより一段下のブラウザ内で画像デコードを止める
+        self.context = await self.playwright.chromium.launch_persistent_context(
+            user_data_dir=os.path.expanduser('~/.cache/spa_crawl'),
+            headless=self.headless,
+            args=[
+                '--disable-dev-shm-usage',
+                '--disable-gpu',
+                '--disable-extensions',
+                '--disable-background-networking',
+                '--disable-sync',
+                '--disable-default-apps',
+                '--disable-translate',
+                '--blink-settings=imagesEnabled=false',
+                '--mute-audio',
+                '--no-first-run',
+                '--no-default-browser-check',
+            ],
+            java_script_enabled=True,
+            bypass_csp=True,
+            # Small fixed viewport — less to lay out / 小さい固定ビューポートでレイアウト量を削減
+            viewport={'width': 1280, 'height': 800}
+        )
+        # Abort subresources the extractor never needs / 抽出に不要なサブリソースのリクエストを中断
+        await self.context.route('**/*', self._route_filter)
+
+        # Plain HTTP client for the static fast path / 静的ファストパス用のプレーンHTTPクライアント
+        self._http = httpx.AsyncClient(
+            http2=True,
+            follow_redirects=True,
+            headers={'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'},
+            timeout=10
+        )
+
+    async def stop_browser(self):
+        """Stop Playwright browser / Playwrightブラウザを停止"""
+        if self._http:
+            await self._http.aclose()
+            self._http = None
+        # Closing the persistent context also shuts down its browser
+        # 永続コンテキストを閉じるとそのブラウザも終了する
+        if self.context:
+            await self.context.close()
+            self.context = None
+        if self.playwright:
+            await self.playwright.stop()
+            self.playwright = None
 
-        return title, description
+    async def _process_url(self, url):
+        """Crawl a single URL / 1つのURLをクロール
 
-    def extract_links(self):
-        """Extract all links from current page / 現在のページから全てのリンクを抽出"""
-        links = []
-        try:
-            # Wait for page to be fully loaded / ページの完全読み込みを待機
-            self.page.wait_for_load_state('networkidle', timeout=10000)
-        except PlaywrightTimeout:
-            pass  # Continue even if timeout / タイムアウトしても続行
+        Everything in the queue went through _filter_and_normalize and the
+        seen set on the enqueue side, so no re-validation happens here.
+        キュー内のURLは全てエンキュー時に_filter_and_normalizeとseenセットを通過済みなので、ここでの再検証は行わない。
+        """
+        self.visited.add(url)
 
-        try:
-            anchors = self.page.query_selector_all('a[href]')
-            for anchor in anchors:
-                try:
-                    href = anchor.get_attribute('href')
-                    if href:
-                        # Convert to absolute URL / 絶対URLに変換
-                        absolute_url = urljoin(self.page.url, href)
-                        links.append(absolute_url)
-                except:
-                    continue
-        except:
-            pass
+        # Crawls stay on one domain today, but the gate is keyed by host so
+        # nothing changes if that ever loosens / 現状クロールは単一ドメインだが、ゲートはホスト単位なので対象が広がっても変更不要
+        await self._throttle(self._domain_netloc)
 
-        return links
+        print(f"Fetching / 取得中: {url}")
 
-    def start_browser(self):
-        """Start Playwright browser / Playwrightブラウザを起動"""
-        self.playwright = sync_playwright().start()
-        self.browser = self.playwright.chromium.launch(headless=self.headless)
-        self.page = self.browser.new_page()
-        self.page.set_default_timeout(30000)
+        # Any unexpected exception must not escape: a dead worker never calls
+        # task_done() again and the queue join would hang the whole crawl
+        # 予期しない例外を外へ漏らさない。ワーカーが死ぬと以後task_done()が呼ばれず、キューのjoinでクロール全体がハングする
+        try:
+            # Static fast path first: even on "SPA" sites most pages are
+            # server-rendered, and a plain GET costs milliseconds where Chromium
+            # costs seconds / まず静的ファストパス。「SPA」サイトでも大半のページはサーバーレンダリングされており、プレーンなGETはミリ秒で済む（Chromiumは秒単位）
+            extracted = await self._fetch_static(url)
+            if extracted is self._SKIP:
+                print(f"  - Skipped (not HTML or too large) / スキップ（HTML以外またはサイズ超過）")
+                return
+            if extracted is None:
+                print(f"  ↻ Rendering with browser / ブラウザでレンダリング")
+                extracted = await self._fetch_rendered(url)
+            if extracted is None:
+                return
+            title, description, links = extracted
+
+            # Write the row out immediately / 行を即座に書き出す
+            self._csv_writer.writerow({
+                'url': url,
+                'title': title,
+                'description': description
+            })
+            self.page_count += 1
+            # Flush every 256 rows; close_csv flushes the tail. Workers all run
+            # on one event loop, so no lock is needed around the writer.
+            # 256行ごとにフラッシュし、残りはclose_csvで書き切る。ワーカーは全て同一イベントループ上で動くため、ライターにロックは不要
+            if self.page_count % 256 == 0:
+                self._csv_fp.flush()
+
+            title_display = title[:50] + '...' if len(title) > 50 else title
+            print(f"  ✓ Title / タイトル: {title_display}")
+
+            # Add extracted links to queue / 抽出したリンクをキューに追加
+            for link in links:
+                normalized_link, link_same_domain, link_valid = self._filter_and_normalize(link)
+                if (link_same_domain and link_valid and
+                        normalized_link not in self.seen):
+                    self.seen.add(normalized_link)
+                    self.to_visit.put_nowait(normalized_link)
+
+        except Exception as e:
+            print(f"  ✗ Error / エラー: {e}")
+
+    async def _fetch_static(self, url):
+        """Try to extract the page without the browser / ブラウザなしでのページ抽出を試みる
+
+        Returns (title, description, links); None when the page looks like an
+        unrendered JS shell — only those pages pay for Chromium; or _SKIP for
+        responses not worth crawling on either path (non-HTML, oversized).
+        (タイトル, ディスクリプション, リンク) を返す。未レンダリングのJSシェルに見える場合はNoneを返し、そのページだけがChromiumのコストを払う。どちらの経路でもクロールする価値のないレスポンス（HTML以外、サイズ超過）には_SKIPを返す。
+        """
+        try:
+            async with self._http.stream('GET', url) as response:
+                if response.status_code != 200:
+                    return None
+                if 'text/html' not in response.headers.get('content-type', ''):
+                    return self._SKIP
+                # Refuse oversized documents from the headers alone — the body
+                # is never downloaded, here or in the browser
+                # ヘッダーだけでサイズ超過のドキュメントを拒否。本文はここでもブラウザでもダウンロードされない
+                if int(response.headers.get('content-length') or 0) > self.MAX_BODY_BYTES:
+                    return self._SKIP
+                # No usable Content-Length: read with a cap and bail once past it
+                # 使えるContent-Lengthがない場合は上限付きで読み、超えた時点で打ち切る
+                chunks = []
+                size = 0
+                async for chunk in response.aiter_bytes():
+                    chunks.append(chunk)
+                    size += len(chunk)
+                    if size > self.MAX_BODY_BYTES:
+                        return self._SKIP
+                body = b''.join(chunks)
+        except httpx.HTTPError:
+            return None
 
-    def stop_browser(self):
-        """Stop Playwright browser / Playwrightブラウザを停止"""
-        if self.page:
-            self.page.close()
-        if self.browser:
-            self.browser.close()
-        if self.playwright:
-            self.playwright.stop()
+        try:
+            text = body.decode(response.charset_encoding or 'utf-8', 'ignore')
+        except LookupError:
+            text = body.decode('utf-8', 'ignore')
+
+        tree = LexborHTMLParser(text)
+        title, description, links = self._extract_from_tree(tree, url)
+
+        # SPA shell heuristics: no content at all, or an empty mount point
+        # with no links — escalate to the browser
+        # SPAシェルのヒューリスティック: コンテンツが皆無、またはリンクのない空のマウントポイント。その場合はブラウザへエスカレーション
+        if not title and not links:
+            return None
+        if not links and tree.css_first('#root, #app'):
+            return None
+
+        return title, description, links
+
+    @staticmethod
+    def _extract_from_tree(tree, base_url):
+        """Extract title, description and links from a parsed tree / パース済みツリーからタイトル、ディスクリプション、リンクを抽出"""
+        title_node = tree.css_first('title')
+        title = title_node.text(strip=True) if title_node else ''
+        meta = (tree.css_first('meta[name="description"]')
+                or tree.css_first('meta[property="og:description"]'))
+        description = (meta.attributes.get('content') or '').strip() if meta else ''
+        # urljoin runs a full parse even for absolute hrefs, and most hrefs
+        # in the wild are absolute — join only when actually needed
+        # urljoinは絶対URLのhrefでも完全なパースを実行する。実際のhrefは絶対URLが大半なので、必要なときだけ結合する
+        links = []
+        for a in tree.css('a[href]'):
+            href = a.attributes.get('href')
+            if not href:
+                continue
+            if href.startswith(('http://', 'https://')):
+                links.append(href)
+            else:
+                links.append(urljoin(base_url, href))
+        return title, description, links
+
+    async def _fetch_rendered(self, url):
+        """Render the page in Chromium and extract / Chromiumでページをレンダリングして抽出"""
+        # A fresh tab per URL gives each crawl a clean DOM while sharing the
+        # context's caches. new_page itself can fail (e.g. after a Chromium
+        # crash), so it lives inside the try as well.
+        # URLごとに新しいタブを使うことで、コンテキストのキャッシュを共有しつつ毎回クリーンなDOMでクロールできる。new_page自体も失敗しうる（Chromiumのクラッシュ後など）ため、tryの内側に置く
+        page = None
+        try:
+            page = await self.context.new_page()
+            page.set_default_timeout(30000)
+            await page.goto(url, wait_until='domcontentloaded')
+
+            # If no links are attached yet, the page is likely still rendering
+            # client-side — wait for the SPA briefly instead of a blind sleep
+            # リンクがまだ付いていない場合はクライアントサイドレンダリング中の可能性が高いので、無条件のsleepではなくSPAを短時間だけ待つ
+            try:
+                if await page.evaluate("document.querySelectorAll('a[href]').length") == 0:
+                    await page.wait_for_function(
+                        "document.querySelectorAll('a[href]').length > 0",
+                        timeout=2000
+                    )
+            except PlaywrightTimeout:
+                pass
+
+            # Extract title, description and links in one round-trip / タイトル、ディスクリプション、リンクを1往復で抽出
+            return await self.extract_page_data(page)
 
-    def crawl(self):
+        except PlaywrightTimeout:
+            print(f"  ✗ Timeout / タイムアウト")
+            return None
+        except Exception as e:
+            print(f"  ✗ Error / エラー: {e}")
+            return None
+        finally:
+            if page is not None:
+                try:
+                    await page.close()
+                except Exception:
+                    pass
+
+    async def _worker(self):
+        """Worker task pulling URLs from the queue / キューからURLを取り出すワーカータスク"""
+        while not self.interrupted:
+            url = await self.to_visit.get()
+            try:
+                await self._process_url(url)
+            finally:
+                self.to_visit.task_done()
+
+    async def crawl(self):
         """Main crawling process / メインのクロール処理"""
         print(f"Crawling started (SPA mode) / クロール開始（SPAモード）: {self.domain}")
         print(f"Output file / 出力ファイル: {self.output_file}")
         print("-" * 50)
 
-        self.start_browser()
+        await self.start_browser()
+        self._throttle_lock = asyncio.Lock()
 
         try:
-            while self.to_visit:
-                url = self.to_visit.popleft()
-                normalized_url = self.normalize_url(url)
-
-                # Skip if already visited / 既に訪問済みの場合はスキップ
-                if normalized_url in self.visited:
-                    continue
+            # Spawn worker tasks / ワーカータスクを起動
+            workers = [asyncio.create_task(self._worker()) for _ in range(self.concurrency)]
 
-                # Skip if not same domain / 同じドメインでない場合はスキップ
-                if not self.is_same_domain(normalized_url):
-                    continue
+            # Wait until the queue is fully drained / キューが空になるまで待機
+            await self.to_visit.join()
 
-                # Skip if not a valid page URL / 有効なページURLでない場合はスキップ
-                if not self.is_valid_page_url(normalized_url):
-                    continue
-
-                self.visited.add(normalized_url)
-
-                try:
-                    print(f"Fetching / 取得中: {normalized_url}")
-                    self.page.goto(normalized_url, wait_until='domcontentloaded')
-
-                    # Wait a bit for SPA to render / SPAのレンダリングを少し待機
-                    time.sleep(0.5)
-
-                    # Extract title and description / タイトルとディスクリプションの抽出
-                    title, description = self.extract_page_info()
-
-                    # Add to results / 結果に追加
-                    self.results.append({
-                        'url': normalized_url,
-                        'title': title,
-                        'description': description
-                    })
-
-                    title_display = title[:50] + '...' if len(title) > 50 else title
-                    print(f"  ✓ Title / タイトル: {title_display}")
-
-                    # Extract links and add to queue / リンクを抽出してキューに追加
-                    links = self.extract_links()
-                    for link in links:
-                        normalized_link = self.normalize_url(link)
-                        if (self.is_same_domain(normalized_link) and
-                            self.is_valid_page_url(normalized_link) and
-                            normalized_link not in self.visited and
-                            normalized_link not in self.to_visit):
-                            self.to_visit.append(normalized_link)
-
-                    # Delay between requests / リクエスト間の待機時間
-                    time.sleep(self.delay)
-
-                except PlaywrightTimeout:
-                    print(f"  ✗ Timeout / タイムアウト")
-                    continue
-                except Exception as e:
-                    print(f"  ✗ Error / エラー: {e}")
-                    continue
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
 
         finally:
-            self.stop_browser()
+            await self.stop_browser()
 
         print("-" * 50)
-        print(f"Crawling completed / クロール完了: {len(self.results)} pages fetched / ページを取得")
+        print(f"Crawling completed / クロール完了: {self.page_count} pages fetched / ページを取得")
 
-    def save_to_csv(self):
-        """Save results to CSV file / 結果をCSVファイルに保存"""
-        if not self.results:
-            print("No results to save / 保存する結果がありません")
+    def close_csv(self):
+        """Flush and close the CSV file / CSVファイルをフラッシュして閉じる"""
+        if self._csv_fp.closed:
             return
+        self._csv_fp.close()
 
-        with open(self.output_file, 'w', newline='', encoding='utf-8-sig') as f:
-            writer = csv.DictWriter(f, fieldnames=['url', 'title', 'description'])
-            writer.writeheader()
-            writer.writerows(self.results)
-
-        print(f"Saved {len(self.results)} pages to CSV file / {len(self.results)}ページをCSVファイルに保存しました: {self.output_file}")
+        if not self.page_count:
+            print("No results to save / 保存する結果がありません")
+            return
+        print(f"Saved {self.page_count} pages to CSV file / {self.page_count}ページをCSVファイルに保存しました: {self.output_file}")
 
 
 def get_domain_filename(domain_url):
@@ -286,6 +575,17 @@ def main():
         default=1.0,
         help='Delay between requests in seconds (default: 1.0) / リクエスト間の待機時間（秒）（デフォルト: 1.0）'
     )
+    parser.add_argument(
+        '-c', '--concurrency',
+        type=int,
+        default=4,
+        help='Number of pages crawled in parallel (default: 4) / 並行してクロールするページ数（デフォルト: 4）'
+    )
+    parser.add_argument(
+        '--bloom',
+        action='store_true',
+        help='Use Bloom filters for URL dedup on very large crawls (requires pybloom-live) / 超大規模クロール向けにURL重複チェックへBloomフィルターを使用（pybloom-liveが必要）'
+    )
     parser.add_argument(
         '--no-headless',
         action='store_true',
@@ -306,28 +606,30 @@ def main():
         args.domain,
         output_file,
         args.delay,
-        headless=not args.no_headless
+        headless=not args.no_headless,
+        concurrency=args.concurrency,
+        use_bloom=args.bloom
     )
 
-    # Set up signal handler to save results on interrupt / 中断時に結果を保存するシグナルハンドラーを設定
+    # Set up signal handler to close the CSV on interrupt; rows already
+    # written are on disk / 中断時にCSVを閉じるシグナルハンドラーを設定。書き込み済みの行はディスクに保存済み
     def signal_handler(signum, frame):
         print("\n" + "-" * 50)
-        print("Interrupted! Saving partial results... / 中断されました！途中結果を保存します...")
-        crawler.stop_browser()
-        crawler.save_to_csv()
+        print("Interrupted! Partial results are already saved... / 中断されました！途中結果は保存済みです...")
+        crawler.interrupted = True
+        crawler.close_csv()
         sys.exit(0)
 
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
 
     try:
-        crawler.crawl()
+        asyncio.run(crawler.crawl())
     except Exception as e:
         print(f"\nUnexpected error occurred / 予期しないエラーが発生しました: {e}")
-        print("Saving partial results... / 途中結果を保存します...")
-        crawler.stop_browser()
+        print("Partial results are already saved / 途中結果は保存済みです")
     finally:
-        crawler.save_to_csv()
+        crawler.close_csv()
 
 
 if __name__ == '__main__':